@@ -3,7 +3,7 @@
 import os
 from pathlib import Path
 
-from tidal_api.session_manager import SessionManager
+from tidal_api.session_manager import SessionManager, get_storage_directory
 from tidal_api.session_storage import SessionStorage
 from tidal_api.tidal_service import TidalService
 
@@ -21,9 +21,8 @@ class Container:
         """Get SessionStorage instance (singleton)."""
         global _session_storage
         if _session_storage is None:
-            # Use home directory for storage
-            home_dir = os.path.expanduser("~")
-            directory = os.path.join(home_dir, ".tidal-mcp", "sessions")
+            # Use TIDAL_MCP_SESSIONS_DIR if set, otherwise the home directory
+            directory = get_storage_directory()
             os.makedirs(directory, exist_ok=True, mode=0o700)
 
             # Get encryption key from environment
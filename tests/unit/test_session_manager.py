@@ -5,14 +5,14 @@ from unittest.mock import Mock, patch
 import pytest
 
 try:
-    from tidal_api.session_manager import SessionManager
+    from tidal_api.session_manager import DEFAULT_STORAGE_DIR, SessionManager, get_storage_directory
     from tidal_api.session_storage import SessionStorage
 except ImportError:
     import sys
     from pathlib import Path as PathLib
 
     sys.path.insert(0, str(PathLib(__file__).parent.parent.parent))
-    from tidal_api.session_manager import SessionManager
+    from tidal_api.session_manager import DEFAULT_STORAGE_DIR, SessionManager, get_storage_directory
     from tidal_api.session_storage import SessionStorage
 
 
@@ -72,7 +72,7 @@ class TestSessionManager:
 
         # Mock storage - no existing session
         mock_storage = Mock(spec=SessionStorage)
-        mock_storage.load_session_sync.return_value = None
+        mock_storage.load_session_future.return_value.result.return_value = None
 
         manager = SessionManager(storage=mock_storage)
         result = manager.authenticate(session_id="test_session_id")
@@ -92,7 +92,7 @@ class TestSessionManager:
 
         # Mock storage - no existing session
         mock_storage = Mock(spec=SessionStorage)
-        mock_storage.load_session_sync.return_value = None
+        mock_storage.load_session_future.return_value.result.return_value = None
 
         manager = SessionManager(storage=mock_storage)
         result = manager.authenticate(session_id="test_session_id")
@@ -144,3 +144,101 @@ class TestSessionManager:
 
         assert result["authenticated"] is False
         assert "No session_id provided" in result["message"]
+
+    def test_missing_session_lookups_are_cached(self):
+        """Test that repeated checks for an unknown session hit storage once."""
+        mock_storage = Mock(spec=SessionStorage)
+        mock_storage.load_session_sync.return_value = None
+
+        manager = SessionManager(storage=mock_storage)
+        for _ in range(3):
+            result = manager.check_authentication_status(session_id="unknown_session")
+            assert result["authenticated"] is False
+
+        mock_storage.load_session_sync.assert_called_once_with("unknown_session")
+
+    def test_check_login_status_completed_login(self):
+        """Test that a completed pending login is saved and removed from pending."""
+        mock_future = Mock()
+        mock_future.done.return_value = True
+        mock_session = Mock()
+        mock_session.check_login.return_value = True
+        mock_session.get_session_data.return_value = {"access_token": "token"}
+        mock_session.user = Mock(id="12345")
+
+        mock_storage = Mock(spec=SessionStorage)
+        manager = SessionManager(storage=mock_storage)
+        manager._pending_logins["test_session_id"] = (mock_future, 300, mock_session)
+
+        result = manager.check_login_status("test_session_id")
+
+        assert result["status"] == "success"
+        assert result["user_id"] == "12345"
+        assert "test_session_id" not in manager._pending_logins
+        mock_storage.save_session_sync.assert_called_once_with(
+            "test_session_id", {"access_token": "token"}
+        )
+
+    @patch("tidal_api.session_manager.BrowserSession")
+    def test_status_checks_reuse_browser_session(self, mock_browser_session):
+        """Test that repeated status checks reuse one BrowserSession per session_id."""
+        mock_session = Mock()
+        mock_session.load_from_data.return_value = True
+        mock_session.check_login.return_value = True
+        mock_session.user = Mock(id="12345", username="testuser", email="test@example.com")
+        mock_browser_session.return_value = mock_session
+
+        mock_storage = Mock(spec=SessionStorage)
+        mock_storage.load_session_sync.return_value = {"token": "test_token"}
+
+        manager = SessionManager(storage=mock_storage)
+        for _ in range(3):
+            result = manager.check_authentication_status(session_id="test_session_id")
+            assert result["authenticated"] is True
+
+        mock_browser_session.assert_called_once()
+        assert mock_session.load_from_data.call_count == 3
+
+    def test_check_login_status_expired_login(self):
+        """Test that a pending login past its deadline is evicted."""
+        mock_future = Mock()
+        mock_future.done.return_value = False
+
+        mock_storage = Mock(spec=SessionStorage)
+        manager = SessionManager(storage=mock_storage)
+        manager._pending_logins["test_session_id"] = (mock_future, 0.0, Mock())
+
+        result = manager.check_login_status("test_session_id")
+
+        assert result["status"] == "error"
+        assert "expired" in result["message"].lower()
+        assert "test_session_id" not in manager._pending_logins
+        mock_future.cancel.assert_called_once()
+
+    @patch("tidal_api.session_manager.BrowserSession")
+    def test_authenticate_sweeps_expired_logins(self, mock_browser_session):
+        """Test that starting a login evicts abandoned pending logins."""
+        mock_session = Mock()
+        mock_session.start_oauth_login.return_value = ("https://auth.url", 300, Mock())
+        mock_browser_session.return_value = mock_session
+
+        mock_storage = Mock(spec=SessionStorage)
+        mock_storage.load_session_future.return_value.result.return_value = None
+
+        manager = SessionManager(storage=mock_storage)
+        stale_future = Mock()
+        stale_future.done.return_value = False
+        manager._pending_logins["stale_session"] = (stale_future, 0.0, Mock())
+
+        manager.authenticate(session_id="new_session")
+
+        assert list(manager._pending_logins) == ["new_session"]
+        stale_future.cancel.assert_called_once()
+
+    def test_storage_directory_env_override(self, monkeypatch):
+        """Test that TIDAL_MCP_SESSIONS_DIR overrides the default storage directory."""
+        monkeypatch.delenv("TIDAL_MCP_SESSIONS_DIR", raising=False)
+        assert get_storage_directory() == DEFAULT_STORAGE_DIR
+
+        monkeypatch.setenv("TIDAL_MCP_SESSIONS_DIR", "/tmp/tidal-sessions")
+        assert get_storage_directory() == "/tmp/tidal-sessions"
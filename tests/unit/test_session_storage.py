@@ -42,6 +42,8 @@ class TestSessionStorage:
             assert loaded_data == session_data
             assert loaded_data["session_id"] == session_id
 
+            storage.close()
+
     def test_list_sessions(self):
         """Test listing all sessions."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -76,6 +78,8 @@ class TestSessionStorage:
             assert "session1" in sessions
             assert "session2" in sessions
 
+            storage.close()
+
     def test_delete_session(self):
         """Test deleting a session."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -104,6 +108,8 @@ class TestSessionStorage:
             assert session_id not in storage.list_sessions_sync()
             assert storage.load_session_sync(session_id) is None
 
+            storage.close()
+
     def test_session_exists(self):
         """Test checking if session exists."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -126,6 +132,22 @@ class TestSessionStorage:
             # Now exists
             assert storage.session_exists_sync(session_id) is True
 
+            storage.close()
+
+    def test_session_exists_checks_stored_entry(self):
+        """Test that an indexed session whose stored entry is gone does not exist."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = SessionStorage(directory=tmpdir)
+            storage.save_session_sync("session1", {"token": "test1"})
+
+            # Remove the entry behind the index's back
+            storage._run_async(storage._store.delete(storage._KEY_PREFIX + "session1"))
+
+            assert "session1" in storage.list_sessions_sync()
+            assert storage.session_exists_sync("session1") is False
+
+            storage.close()
+
     def test_index_persistence(self):
         """Test that index persists across storage instances."""
         from cryptography.fernet import Fernet
@@ -139,6 +161,7 @@ class TestSessionStorage:
             storage1 = SessionStorage(directory=tmpdir, encryption_key=encryption_key)
             storage1.save_session_sync("session1", {"session_id": "session1", "token": "token1"})
             storage1.save_session_sync("session2", {"session_id": "session2", "token": "token2"})
+            storage1.close()
 
             # Create second storage instance (simulating restart) with same key
             storage2 = SessionStorage(directory=tmpdir, encryption_key=encryption_key)
@@ -153,6 +176,59 @@ class TestSessionStorage:
             assert storage2.load_session_sync("session1") is not None
             assert storage2.load_session_sync("session2") is not None
 
+            storage2.close()
+
+    def test_index_flushed_after_delay(self):
+        """Test that batched index updates reach DiskStore without an explicit close."""
+        import time
+
+        from cryptography.fernet import Fernet
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            encryption_key = Fernet.generate_key().decode("utf-8")
+
+            storage1 = SessionStorage(directory=tmpdir, encryption_key=encryption_key)
+            storage1.save_session_sync("session1", {"session_id": "session1"})
+
+            # Wait for the debounced flush to run
+            time.sleep(SessionStorage.INDEX_FLUSH_DELAY * 4)
+
+            storage2 = SessionStorage(directory=tmpdir, encryption_key=encryption_key)
+            assert storage2.list_sessions_sync() == ["session1"]
+
+            storage1.close()
+            storage2.close()
+
+    def test_failed_index_flush_is_retried(self):
+        """Test that an index write that fails stays pending and is written later."""
+        import time
+
+        from cryptography.fernet import Fernet
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            encryption_key = Fernet.generate_key().decode("utf-8")
+            storage1 = SessionStorage(directory=tmpdir, encryption_key=encryption_key)
+
+            put = storage1._store.put
+            failures = []
+
+            async def put_failing_index_once(key, value, **kwargs):
+                if key == SessionStorage.INDEX_KEY and not failures:
+                    failures.append(key)
+                    raise OSError("disk full")
+                return await put(key, value, **kwargs)
+
+            storage1._store.put = put_failing_index_once
+            storage1.save_session_sync("a", {"token": "a"})
+            time.sleep(SessionStorage.INDEX_FLUSH_DELAY * 2)
+            storage1.save_session_sync("a", {"token": "a"})
+            storage1.close()
+
+            storage2 = SessionStorage(directory=tmpdir, encryption_key=encryption_key)
+            assert failures
+            assert storage2.list_sessions_sync() == ["a"]
+            storage2.close()
+
     def test_no_file_index_created(self):
         """Test that no .sessions_index.json file is created."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -177,3 +253,32 @@ class TestSessionStorage:
             sessions = storage.list_sessions_sync()
             assert session_id in sessions
 
+            storage.close()
+
+
+    def test_load_session_future(self):
+        """Test that load_session_future resolves to the stored session data."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = SessionStorage(directory=tmpdir)
+            storage.save_session_sync("session1", {"token": "test1"})
+
+            future = storage.load_session_future("session1")
+
+            assert future.result(timeout=5) == {"token": "test1"}
+            assert storage.load_session_future("missing").result(timeout=5) is None
+
+            storage.close()
+
+    def test_collected_storage_stops_loop_thread(self):
+        """Test that an unclosed storage doesn't keep its loop thread alive once collected."""
+        import gc
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = SessionStorage(directory=tmpdir)
+            loop_thread = storage._loop_thread
+
+            del storage
+            gc.collect()
+            loop_thread.join(timeout=5)
+
+            assert not loop_thread.is_alive()
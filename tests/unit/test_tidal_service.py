@@ -1,8 +1,10 @@
 """Unit tests for TIDAL service."""
 
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
+import tidalapi
 
 try:
     from tidal_api.tidal_service import TidalService
@@ -18,6 +20,17 @@ except ImportError:
 class TestTidalService:
     """Test TidalService class."""
 
+    @staticmethod
+    def _mock_track(track_id: str) -> Mock:
+        """Create a mock track with the attributes format_track_data reads."""
+        track = Mock()
+        track.id = track_id
+        track.name = f"Track {track_id}"
+        track.artist.name = "Test Artist"
+        track.album.name = "Test Album"
+        track.duration = 180
+        return track
+
     @pytest.fixture
     def mock_session_manager(self):
         """Create a mock session manager."""
@@ -94,3 +107,221 @@ class TestTidalService:
 
         with pytest.raises(ValueError, match="not found"):
             service.get_track_recommendations(track_id="999", limit=10)
+
+    def test_get_batch_recommendations(self, mock_session_manager, mock_session):
+        """Test batch recommendations with a bounded worker pool and de-duplication."""
+        mock_session_manager.get_authenticated_session.return_value = mock_session
+        mock_session.track.return_value.get_track_radio.return_value = [
+            self._mock_track("1"),
+            self._mock_track("2"),
+        ]
+
+        service = TidalService(mock_session_manager, max_batch_workers=2)
+        result = service.get_batch_recommendations(track_ids=["10", "20", "30"])
+
+        assert sorted(track.id for track in result.recommendations) == ["1", "2"]
+        assert mock_session.track.call_count == 3
+
+    def test_get_batch_recommendations_repeated_in_one_radio(
+        self, mock_session_manager, mock_session
+    ):
+        """Test that a track repeated within one radio list is returned once."""
+        mock_session_manager.get_authenticated_session.return_value = mock_session
+        mock_session.track.return_value.get_track_radio.return_value = [
+            self._mock_track("1"),
+            self._mock_track("1"),
+            self._mock_track("2"),
+        ]
+
+        service = TidalService(mock_session_manager)
+        result = service.get_batch_recommendations(track_ids=["10"])
+
+        assert [track.id for track in result.recommendations] == ["1", "2"]
+
+    def test_get_batch_recommendations_empty(self, mock_session_manager):
+        """Test that an empty batch returns without touching the session."""
+        service = TidalService(mock_session_manager)
+
+        result = service.get_batch_recommendations(track_ids=[])
+
+        assert result.recommendations == []
+        mock_session_manager.get_authenticated_session.assert_not_called()
+
+    def test_get_batch_recommendations_all_failed(self, mock_session_manager, mock_session):
+        """Test that a batch where every track fails raises and drops the cached session."""
+        mock_session_manager.get_authenticated_session.return_value = mock_session
+        mock_session.track.side_effect = RuntimeError("401 Unauthorized")
+
+        service = TidalService(mock_session_manager)
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="all 2 tracks"):
+                service.get_batch_recommendations(track_ids=["10", "20"])
+
+        assert mock_session_manager.get_authenticated_session.call_count == 2
+
+    def test_get_batch_recommendations_max_results_zero(self, mock_session_manager):
+        """Test that a non-positive max_results returns nothing without any requests."""
+        service = TidalService(mock_session_manager)
+
+        result = service.get_batch_recommendations(track_ids=["10"], max_results=0)
+
+        assert result.recommendations == []
+        mock_session_manager.get_authenticated_session.assert_not_called()
+
+    def test_close_shuts_down_executor(self, mock_session_manager):
+        """Test that close() shuts down the shared worker pool."""
+        service = TidalService(mock_session_manager)
+
+        service.close()
+
+        with pytest.raises(RuntimeError):
+            service._executor.submit(lambda: None)
+
+    def test_get_batch_recommendations_max_results(self, mock_session_manager, mock_session):
+        """Test that max_results truncates the batch and cancels pending requests."""
+        mock_session_manager.get_authenticated_session.return_value = mock_session
+        mock_session.track.return_value.get_track_radio.return_value = [
+            self._mock_track("1"),
+            self._mock_track("2"),
+            self._mock_track("3"),
+        ]
+
+        service = TidalService(mock_session_manager, max_batch_workers=1)
+        result = service.get_batch_recommendations(track_ids=["10", "20"], max_results=2)
+
+        assert [track.id for track in result.recommendations] == ["1", "2"]
+
+    def test_track_lookups_are_cached(self, mock_session_manager, mock_session):
+        """Test that repeated source tracks are fetched once per session."""
+        mock_session_manager.get_authenticated_session.return_value = mock_session
+        mock_session.track.return_value.get_track_radio.return_value = []
+
+        service = TidalService(mock_session_manager)
+        service.set_session_id("user1")
+        service.get_batch_recommendations(track_ids=["10", "10", "20"])
+        service.get_track_recommendations(track_id="10")
+
+        assert sorted(call.args for call in mock_session.track.call_args_list) == [
+            ("10",),
+            ("20",),
+        ]
+
+        service.set_session_id("user2")
+        service.get_track_recommendations(track_id="10")
+
+        assert mock_session.track.call_count == 3
+
+    def test_track_cached_under_resolved_session_id(self, mock_session_manager):
+        """Test that a session_id switch mid-call can't file one user's track under another."""
+        sessions = {"user1": Mock(), "user2": Mock()}
+        for session in sessions.values():
+            session.track.return_value.get_track_radio.return_value = []
+        mock_session_manager.get_authenticated_session.side_effect = sessions.__getitem__
+
+        class SwitchingService(TidalService):
+            """Service whose session_id changes between consecutive reads."""
+
+            _ids = iter(["user1", "user2"])
+            _current_session_id = property(lambda self: next(self._ids), lambda self, v: None)
+
+        service = SwitchingService(mock_session_manager)
+        service.get_track_recommendations(track_id="10")
+
+        [(cached_session_id, _)] = service._track_cache
+        sessions[cached_session_id].track.assert_called_once_with("10")
+
+    def test_track_cache_dropped_with_session(self, mock_session_manager):
+        """Test that cached tracks are not reused after the session is invalidated."""
+        old_session, new_session = Mock(), Mock()
+        mock_session_manager.get_authenticated_session.side_effect = [old_session, new_session]
+        old_session.track.return_value.get_track_radio.side_effect = RuntimeError("401")
+        new_session.track.return_value.get_track_radio.return_value = []
+
+        service = TidalService(mock_session_manager)
+        with pytest.raises(RuntimeError):
+            service.get_track_recommendations(track_id="10")
+        service.get_track_recommendations(track_id="10")
+
+        new_session.track.assert_called_once_with("10")
+
+    def test_session_reused_until_error(self, mock_session_manager, mock_session):
+        """Test that the authenticated session is cached and dropped after a failure."""
+        mock_session_manager.get_authenticated_session.return_value = mock_session
+        mock_session.user.playlists.return_value = []
+
+        service = TidalService(mock_session_manager)
+        service.set_session_id("user1")
+        service.get_user_playlists()
+        service.get_user_playlists()
+
+        mock_session_manager.get_authenticated_session.assert_called_once_with("user1")
+
+        mock_session.user.playlists.side_effect = RuntimeError("401 Unauthorized")
+        with pytest.raises(RuntimeError):
+            service.get_user_playlists()
+
+        mock_session.user.playlists.side_effect = None
+        service.get_user_playlists()
+
+        assert mock_session_manager.get_authenticated_session.call_count == 2
+
+    def test_search_tidal(self, mock_session_manager, mock_session):
+        """Test that search_tidal requests only the selected types and formats them."""
+        mock_session_manager.get_authenticated_session.return_value = mock_session
+        mock_session.search.return_value = {"tracks": [self._mock_track("1")], "albums": []}
+
+        service = TidalService(mock_session_manager)
+        result = service.search_tidal("queen", search_types=" Albums,tracks")
+
+        _, kwargs = mock_session.search.call_args
+        assert kwargs["models"] == [tidalapi.Track, tidalapi.Album]
+        assert [track.id for track in result.results.tracks] == ["1"]
+        assert result.total_tracks == 1
+        assert result.total_albums == 0
+        assert result.total_artists == 0
+
+    def test_search_tidal_invalid_types(self, mock_session_manager, mock_session):
+        """Test that search_tidal rejects search_types without a known type."""
+        mock_session_manager.get_authenticated_session.return_value = mock_session
+
+        service = TidalService(mock_session_manager)
+
+        with pytest.raises(ValueError, match="Invalid types"):
+            service.search_tidal("queen", search_types="playlists")
+
+    def test_get_user_playlists(self, mock_session_manager, mock_session):
+        """Test that playlists are formatted and sorted by last update, newest first."""
+        mock_session_manager.get_authenticated_session.return_value = mock_session
+        playlists = []
+        for playlist_id, updated in (("a", "2024-01-01T00:00:00"), ("b", "2024-06-01T00:00:00")):
+            playlist = Mock()
+            playlist.id = playlist_id
+            playlist.name = f"Playlist {playlist_id}"
+            playlist.description = None
+            playlist.created = None
+            playlist.last_updated = updated
+            playlist.num_tracks = 3
+            playlist.duration = 600
+            playlists.append(playlist)
+        mock_session.user.playlists.return_value = playlists
+
+        service = TidalService(mock_session_manager)
+        result = service.get_user_playlists()
+
+        assert [playlist.id for playlist in result.playlists] == ["b", "a"]
+        assert result.playlists[0].description == ""
+        assert result.playlists[0].track_count == 3
+        assert str(result.playlists[0].url) == "https://tidal.com/playlist/b"
+
+    def test_format_playlist_missing_optional_fields(self):
+        """Test that playlists without optional attributes use defaults."""
+        playlist = SimpleNamespace(id=42, name="Minimal")
+
+        result = TidalService._format_playlist(playlist)
+
+        assert result.id == "42"
+        assert result.title == "Minimal"
+        assert result.description == ""
+        assert result.created is None
+        assert result.track_count == 0
+        assert result.duration == 0
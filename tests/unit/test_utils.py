@@ -0,0 +1,246 @@
+"""Unit tests for formatting utilities."""
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+try:
+    from tidal_api import utils
+    from tidal_api.utils import (
+        _safe_get_name,
+        bound_limit,
+        format_album_data,
+        format_artist_data,
+        format_playback_history_item,
+        format_recently_played_item,
+        format_track_data,
+    )
+except ImportError:
+    import sys
+    from pathlib import Path
+
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from tidal_api import utils
+    from tidal_api.utils import (
+        _safe_get_name,
+        bound_limit,
+        format_album_data,
+        format_artist_data,
+        format_playback_history_item,
+        format_recently_played_item,
+        format_track_data,
+    )
+
+
+@pytest.mark.unit
+class TestUtils:
+    """Test formatting helpers."""
+
+    def test_safe_get_name(self):
+        """Test name extraction from objects, strings and missing values."""
+        assert _safe_get_name(SimpleNamespace(name="Queen")) == "Queen"
+        assert _safe_get_name("Queen") == "Queen"
+        assert _safe_get_name(None) == "Unknown"
+        assert _safe_get_name(SimpleNamespace(name=None)) == "Unknown"
+        assert _safe_get_name(42) == "42"
+
+    def test_safe_get_name_unprintable_object(self):
+        """Test that an object whose __str__ fails falls back to Unknown."""
+
+        class Unprintable:
+            def __str__(self):
+                raise TypeError("no string form")
+
+        assert _safe_get_name(Unprintable()) == "Unknown"
+
+    def test_format_track_data(self):
+        """Test formatting a track object into a TrackModel."""
+        track = SimpleNamespace(
+            id=123,
+            name="Bohemian Rhapsody",
+            duration=355,
+            artist=SimpleNamespace(name="Queen"),
+            album=SimpleNamespace(name="A Night at the Opera"),
+        )
+
+        result = format_track_data(track, source_track_id=42)
+
+        assert result.id == "123"
+        assert result.title == "Bohemian Rhapsody"
+        assert result.artist == "Queen"
+        assert result.album == "A Night at the Opera"
+        assert result.duration == 355
+        assert str(result.url) == "https://tidal.com/browse/track/123?u"
+        assert result.source_track_id == "42"
+
+    def test_format_track_data_missing_fields(self):
+        """Test that missing track attributes fall back to defaults."""
+        result = format_track_data(SimpleNamespace())
+
+        assert result.id is None
+        assert result.title == "Unknown Track"
+        assert result.artist == "Unknown"
+        assert result.album == "Unknown"
+        assert result.duration == 0
+        assert result.url is None
+
+    def test_formatters_reject_extra_positional_arguments(self):
+        """Test that a stray positional argument raises instead of replacing internals."""
+        track = SimpleNamespace(id=1, name="Song")
+
+        with pytest.raises(TypeError):
+            format_track_data(track, "2", "extra")
+        with pytest.raises(TypeError):
+            format_recently_played_item(track, None, "extra")
+        with pytest.raises(TypeError):
+            format_artist_data(track, "extra")
+        with pytest.raises(TypeError):
+            format_album_data(track, "extra")
+
+    def test_track_normalization_errors_are_not_retried(self):
+        """Test that only missing fields trigger the per-field fallback."""
+        track = SimpleNamespace(id=1, name="Song", duration=1, artist=None, album=None)
+
+        with patch.object(utils, "_track_core", side_effect=AttributeError("boom")) as core:
+            with pytest.raises(AttributeError, match="boom"):
+                utils._track_core_from_obj(track)
+
+        core.assert_called_once()
+
+    def test_bound_limit(self):
+        """Test clamping limits to [1, max_n]."""
+        assert bound_limit(0) == 1
+        assert bound_limit(-5) == 1
+        assert bound_limit(20) == 20
+        assert bound_limit(500) == 50
+        assert bound_limit(500, max_n=100) == 100
+
+    def test_format_album_data_reuses_models(self):
+        """Test that formatting the same album twice returns the cached model."""
+        album = SimpleNamespace(
+            id=87654321,
+            name="A Night at the Opera",
+            release_date="1975-10-31",
+            duration=4320,
+            num_tracks=12,
+            artist=SimpleNamespace(name="Queen"),
+        )
+
+        result = format_album_data(album)
+
+        assert result.id == "87654321"
+        assert result.artist == "Queen"
+        assert result.release_date == "1975-10-31"
+        assert str(result.url) == "https://tidal.com/browse/album/87654321?u"
+        assert format_album_data(album) is result
+
+    def test_format_album_data_missing_fields(self):
+        """Test that albums without optional attributes use defaults."""
+        result = format_album_data(SimpleNamespace(id=42, name="Minimal"))
+
+        assert result.id == "42"
+        assert result.title == "Minimal"
+        assert result.artist == "Unknown"
+        assert result.release_date is None
+        assert result.duration == 0
+        assert result.num_tracks == 0
+
+    def test_format_artist_data_reuses_models(self):
+        """Test that artists with the same fields share a model and others do not."""
+        result = format_artist_data(SimpleNamespace(id=11111111, name="Queen"))
+
+        assert result.name == "Queen"
+        assert str(result.url) == "https://tidal.com/browse/artist/11111111?u"
+        assert format_artist_data(SimpleNamespace(id=11111111, name="Queen")) is result
+        assert format_artist_data(SimpleNamespace(id=11111111, name="Queen II")) is not result
+
+    def test_configure_ssl_certificates_runs_once(self, monkeypatch):
+        """Test that SSL configuration is applied once and its result reused."""
+        monkeypatch.setattr(utils, "_SSL_CONFIGURED", None)
+
+        with patch.object(utils, "_configure_ssl_certificates", return_value=True) as configure:
+            assert utils.configure_ssl_certificates() is True
+            assert utils.configure_ssl_certificates() is True
+
+        configure.assert_called_once()
+
+    def test_format_recently_played_item_from_dict(self):
+        """Test formatting a recently played dict that uses 'title' instead of 'name'."""
+        played_at = datetime(2024, 1, 15, 10, 30)
+        track = {
+            "id": 7,
+            "title": "Song",
+            "duration": None,
+            "artist": "Queen",
+            "played_at": played_at,
+        }
+
+        result = format_recently_played_item(track)
+
+        assert result.id == "7"
+        assert result.title == "Song"
+        assert result.artist == "Queen"
+        assert result.album == "Unknown"
+        assert result.duration == 0
+        assert result.played_at == played_at
+
+    def test_format_recently_played_item_from_object(self):
+        """Test that an explicit played_at overrides the track object's timestamp."""
+        played_at = datetime(2024, 1, 15, 10, 30)
+        track = SimpleNamespace(
+            id=7, name="Song", artist=SimpleNamespace(name="Queen"), played_at=datetime(2020, 1, 1)
+        )
+
+        result = format_recently_played_item(track, played_at=played_at)
+
+        assert str(result.url) == "https://tidal.com/browse/track/7?u"
+        assert result.artist == "Queen"
+        assert result.played_at == played_at
+
+    def test_format_playback_history_item(self):
+        """Test play counts and timestamps from dicts, objects and arguments."""
+        first = datetime(2022, 1, 15)
+        last = datetime(2024, 12, 1)
+
+        from_dict = format_playback_history_item(
+            {"id": 1, "name": "Song", "play_count": 42, "first_played": first}, last_played=last
+        )
+        assert from_dict.play_count == 42
+        assert from_dict.first_played == first
+        assert from_dict.last_played == last
+
+        from_object = format_playback_history_item(SimpleNamespace(id=1, name="Song", play_count=5))
+        assert from_object.play_count == 5
+        assert from_object.first_played is None
+
+        explicit = format_playback_history_item(
+            SimpleNamespace(id=1, name="Song", play_count=5), play_count=1
+        )
+        assert explicit.play_count == 1
+
+        defaulted = format_playback_history_item({"id": 1, "name": "Song", "play_count": None})
+        assert defaulted.play_count == 1
+
+    def test_format_track_data_reuses_models(self):
+        """Test that identical tracks share a model unless the source track differs."""
+        track = SimpleNamespace(id=5, name="Song", artist="Queen", album="Opera", duration=100)
+
+        result = format_track_data(track)
+
+        assert format_track_data(track) is result
+        assert format_track_data(track, source_track_id=9) is not result
+
+    def test_shared_models_are_frozen(self):
+        """Test that cached models cannot be mutated by one caller for the next."""
+        track = format_track_data(SimpleNamespace(id=6, name="Song", duration=100))
+        album = format_album_data(SimpleNamespace(id=7, name="Opera"))
+        artist = format_artist_data(SimpleNamespace(id=8, name="Queen"))
+
+        for model, field in ((track, "title"), (album, "title"), (artist, "name")):
+            with pytest.raises(ValidationError):
+                setattr(model, field, "mutated")
+
+        assert format_track_data(SimpleNamespace(id=6, name="Song", duration=100)).title == "Song"
@@ -26,6 +26,8 @@ class TrackModel(BaseModel):
     source_track_id: str | None = Field(None, description="Source track ID for recommendations")
 
     class Config:
+        # Instances are cached and shared by the formatters in utils.py
+        frozen = True
         json_schema_extra = {
             "example": {
                 "id": "12345678",
@@ -75,6 +77,8 @@ class AlbumModel(BaseModel):
     url: HttpUrl | None = Field(None, description="TIDAL album URL")
 
     class Config:
+        # Instances are cached and shared by the formatters in utils.py
+        frozen = True
         json_schema_extra = {
             "example": {
                 "id": "87654321",
@@ -96,6 +100,8 @@ class ArtistModel(BaseModel):
     url: HttpUrl | None = Field(None, description="TIDAL artist URL")
 
     class Config:
+        # Instances are cached and shared by the formatters in utils.py
+        frozen = True
         json_schema_extra = {
             "example": {
                 "id": "11111111",
@@ -5,8 +5,10 @@ Handles authentication and session lifecycle for TIDAL API access.
 Supports per-user sessions for cloud deployment using DiskStore.
 """
 
+import concurrent.futures
 import os
 import threading
+import time
 import uuid
 from pathlib import Path
 
@@ -19,10 +21,32 @@ except ImportError:
     from logger import logger
     from session_storage import SessionStorage
 
+# Resolved once at import; expanduser consults the environment/passwd database
+_HOME = os.path.expanduser("~")
+DEFAULT_STORAGE_DIR = os.path.join(_HOME, ".tidal-mcp", "sessions")
+
+
+def get_storage_directory() -> str:
+    """
+    Resolve the session storage directory.
+
+    Honors the TIDAL_MCP_SESSIONS_DIR environment variable (user-expanded) and falls
+    back to DEFAULT_STORAGE_DIR.
+    """
+    env_dir = os.getenv("TIDAL_MCP_SESSIONS_DIR")
+    if env_dir:
+        return os.path.expanduser(env_dir)
+    return DEFAULT_STORAGE_DIR
+
 
 class SessionManager:
     """Manages TIDAL authentication and session lifecycle with per-user session support."""
 
+    INFLIGHT_TIMEOUT = 30.0  # Seconds a caller waits on another caller's session validation
+    NEGATIVE_CACHE_TTL = 2.0  # Seconds to remember that a session_id has no stored session
+    NEGATIVE_CACHE_MAX = 1024  # Upper bound on remembered missing session_ids
+    BROWSER_POOL_MAX = 256  # Upper bound on BrowserSessions kept for status checks
+
     def __init__(self, storage: SessionStorage | None = None):
         """
         Initialize session manager with DiskStore storage.
@@ -30,7 +54,10 @@ class SessionManager:
         Args:
             storage: Optional SessionStorage instance. If None, creates default storage.
         """
-        self._pending_logins: dict[str, tuple] = {}  # session_id -> (future, expires_in, session)
+        self._pending_logins: dict[str, tuple] = {}  # session_id -> (future, deadline, session)
+        self._inflight: dict[str, concurrent.futures.Future] = {}  # session_id -> validation
+        self._negative_cache: dict[str, float] = {}  # session_id -> expiry (monotonic)
+        self._browser_pool: dict[str, BrowserSession] = {}  # session_id -> reusable session
         self._lock = threading.Lock()
 
         # Initialize storage
@@ -43,10 +70,115 @@ class SessionManager:
 
     def _get_storage_directory(self) -> str:
         """Get storage directory path."""
-        home_dir = os.path.expanduser("~")
-        config_dir = os.path.join(home_dir, ".tidal-mcp", "sessions")
-        os.makedirs(config_dir, exist_ok=True, mode=0o700)
-        return config_dir
+        directory = get_storage_directory()
+        os.makedirs(directory, exist_ok=True, mode=0o700)
+        return directory
+
+    def _single_flight(self, key: str, fn, fallback=None):
+        """
+        Run fn once for concurrent callers with the same key and share its result.
+
+        A caller that gives up waiting after INFLIGHT_TIMEOUT runs fallback (default: fn)
+        itself, while the original call may still be running.
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = concurrent.futures.Future()
+                self._inflight[key] = future
+
+        if not owner:
+            try:
+                return future.result(timeout=self.INFLIGHT_TIMEOUT)
+            except concurrent.futures.TimeoutError:
+                return (fallback or fn)()
+
+        try:
+            result = fn()
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _remember_missing(self, session_id: str) -> None:
+        """Record that session_id has no stored session for NEGATIVE_CACHE_TTL seconds."""
+        now = time.monotonic()
+        with self._lock:
+            if len(self._negative_cache) >= self.NEGATIVE_CACHE_MAX:
+                self._negative_cache = {
+                    key: expiry for key, expiry in self._negative_cache.items() if expiry > now
+                }
+                if len(self._negative_cache) >= self.NEGATIVE_CACHE_MAX:
+                    self._negative_cache.clear()
+            self._negative_cache[session_id] = now + self.NEGATIVE_CACHE_TTL
+
+    def _get_browser_session(self, session_id: str) -> BrowserSession:
+        """
+        Get the pooled BrowserSession used to validate session_id, creating it if needed.
+
+        Reusing the session keeps its HTTP connection pool warm across status checks.
+        Validation is single-flight per session_id, and a caller that times out waiting
+        validates with its own BrowserSession, so a pooled session is never shared by
+        concurrent checks.
+        """
+        with self._lock:
+            session = self._browser_pool.get(session_id)
+            if session is None:
+                if len(self._browser_pool) >= self.BROWSER_POOL_MAX:
+                    # Evict the oldest entry (dicts preserve insertion order)
+                    del self._browser_pool[next(iter(self._browser_pool))]
+                session = BrowserSession()
+                self._browser_pool[session_id] = session
+            return session
+
+    def _validate_stored_session(self, session_id: str) -> tuple[bool, dict | None]:
+        """
+        Load a stored session and validate it against TIDAL.
+
+        Concurrent calls for the same session_id (e.g. rapid status polling) share
+        a single load and validation round trip.
+
+        Returns:
+            Tuple of (exists, user_info); user_info is None unless the session is valid
+        """
+        # Short-circuit repeated lookups for unknown session_ids
+        if self._negative_cache.get(session_id, 0.0) > time.monotonic():
+            return False, None
+
+        def validate(pooled: bool = True) -> tuple[bool, dict | None]:
+            session_data = self._storage.load_session_sync(session_id)
+            if not session_data:
+                self._remember_missing(session_id)
+                return False, None
+
+            try:
+                # load_from_data replaces the tokens, so a pooled session is safe to reuse
+                session = self._get_browser_session(session_id) if pooled else BrowserSession()
+                success = session.load_from_data(session_data)
+
+                if success and session.check_login() and session.user:
+                    return True, {
+                        "id": str(session.user.id),
+                        "username": getattr(session.user, "username", None) or "N/A",
+                        "email": getattr(session.user, "email", None) or "N/A",
+                    }
+            except Exception as e:
+                logger.debug(f"Session check error: {e}")
+
+            if pooled:
+                # Don't keep sessions that failed validation around for reuse
+                with self._lock:
+                    self._browser_pool.pop(session_id, None)
+            return True, None
+
+        # The owner may still be using the pooled session when a waiter times out
+        return self._single_flight(session_id, validate, fallback=lambda: validate(pooled=False))
 
     def get_authenticated_session(self, session_id: str | None = None) -> BrowserSession:
         """
@@ -83,6 +215,22 @@ class SessionManager:
 
         return session
 
+    def _sweep_expired_logins(self, now: float) -> None:
+        """
+        Drop pending logins whose deadline has passed so abandoned flows don't accumulate.
+
+        Caller must hold self._lock.
+        """
+        expired = [
+            session_id
+            for session_id, (_, deadline, _) in self._pending_logins.items()
+            if deadline <= now
+        ]
+        for session_id in expired:
+            future, _, _ = self._pending_logins.pop(session_id)
+            if not future.done():
+                future.cancel()
+
     def authenticate(self, session_id: str | None = None) -> dict:
         """
         Start TIDAL authentication flow and return auth URL immediately (non-blocking).
@@ -102,10 +250,12 @@ class SessionManager:
             else:
                 session_id = str(uuid.uuid4())
 
+        # Start the stored-session read first so it overlaps BrowserSession construction
+        load_future = self._storage.load_session_future(session_id)
         session = BrowserSession()
 
         # Try to load existing session first
-        session_data = self._storage.load_session_sync(session_id)
+        session_data = load_future.result()
         if session_data:
             try:
                 success = session.load_from_data(session_data)
@@ -123,9 +273,11 @@ class SessionManager:
         try:
             auth_url, expires_in, future = session.start_oauth_login()
 
-            # Store pending login for status checking (REMOVE session_file from tuple)
+            # Store pending login for status checking, with a monotonic expiry deadline
+            now = time.monotonic()
             with self._lock:
-                self._pending_logins[session_id] = (future, expires_in, session)
+                self._sweep_expired_logins(now)
+                self._pending_logins[session_id] = (future, now + expires_in, session)
 
             logger.info(f"TIDAL AUTH: Started login flow for session {session_id}")
 
@@ -150,88 +302,84 @@ class SessionManager:
         Returns:
             Dictionary with authentication status
         """
-        # Check if login is pending
+        # Check if login is pending; a completed login is claimed under the lock and
+        # finished outside it so storage I/O doesn't block other callers
+        now = time.monotonic()
         with self._lock:
-            if session_id in self._pending_logins:
-                future, expires_in, session = self._pending_logins[session_id]
-
-                # Check if login completed
-                if future.done():
-                    try:
-                        future.result(timeout=0)  # Check immediately, don't wait
-                        # Login completed successfully - verify session is valid
-                        if session.check_login():
-                            # Extract session data and save to DiskStore
-                            session_data = session.get_session_data()
-                            self._storage.save_session_sync(session_id, session_data)
-
-                            # Get user info
-                            user_id = None
-                            if session.user:
-                                user_id = str(session.user.id)
-
-                            # Remove from pending
-                            del self._pending_logins[session_id]
-
-                            return {
-                                "status": "success",
-                                "authenticated": True,
-                                "message": "Authentication completed",
-                                "session_id": session_id,
-                                "user_id": user_id,
-                            }
-                        else:
-                            # Future completed but session not valid
-                            del self._pending_logins[session_id]
-                            return {
-                                "status": "error",
-                                "authenticated": False,
-                                "message": "Authentication failed - session not valid",
-                            }
-                    except Exception as e:
-                        # Future completed with error
-                        del self._pending_logins[session_id]
-                        logger.error(f"Login future error: {e}", exc_info=True)
-                        return {
-                            "status": "error",
-                            "authenticated": False,
-                            "message": f"Authentication error: {str(e)}",
-                        }
-                else:
-                    # Still pending - check if expired
-                    # Note: We don't track start time, so we can't check expiration here
-                    # The OAuth flow itself will timeout
-                    return {
-                        "status": "pending",
-                        "authenticated": False,
-                        "message": "Authentication in progress",
-                        "session_id": session_id,
-                        "expires_in": expires_in,
-                    }
+            entry = self._pending_logins.get(session_id)
+            completed = entry is not None and entry[0].done()
+            expired = entry is not None and not completed and entry[1] <= now
+            if completed or expired:
+                del self._pending_logins[session_id]
+
+        if entry is not None:
+            future, deadline, session = entry
+
+            if expired:
+                future.cancel()
+                return {
+                    "status": "error",
+                    "authenticated": False,
+                    "message": "Authentication expired - please login again",
+                }
+
+            if not completed:
+                # Still pending
+                return {
+                    "status": "pending",
+                    "authenticated": False,
+                    "message": "Authentication in progress",
+                    "session_id": session_id,
+                    "expires_in": int(deadline - now),
+                }
 
-        # Check existing session in DiskStore
-        session_data = self._storage.load_session_sync(session_id)
-        if session_data:
             try:
-                session = BrowserSession()
-                success = session.load_from_data(session_data)
-
-                if success and session.check_login() and session.user:
-                    user_info = {
-                        "id": str(session.user.id),
-                        "username": getattr(session.user, "username", None) or "N/A",
-                        "email": getattr(session.user, "email", None) or "N/A",
-                    }
+                future.result(timeout=0)  # Check immediately, don't wait
+                # Login completed successfully - verify session is valid
+                if session.check_login():
+                    # Extract session data and save to DiskStore
+                    session_data = session.get_session_data()
+                    self._storage.save_session_sync(session_id, session_data)
+                    self._negative_cache.pop(session_id, None)
+
+                    # Get user info
+                    user_id = None
+                    if session.user:
+                        user_id = str(session.user.id)
 
                     return {
                         "status": "success",
                         "authenticated": True,
-                        "message": "Valid TIDAL session",
+                        "message": "Authentication completed",
                         "session_id": session_id,
-                        "user": user_info,
+                        "user_id": user_id,
+                    }
+                else:
+                    # Future completed but session not valid
+                    return {
+                        "status": "error",
+                        "authenticated": False,
+                        "message": "Authentication failed - session not valid",
                     }
             except Exception as e:
-                logger.debug(f"Session check error: {e}")
+                # Future completed with error
+                logger.error(f"Login future error: {e}", exc_info=True)
+                return {
+                    "status": "error",
+                    "authenticated": False,
+                    "message": f"Authentication error: {str(e)}",
+                }
+
+        # Check existing session in DiskStore
+        _, user_info = self._validate_stored_session(session_id)
+        if user_info:
+            return {
+                "status": "success",
+                "authenticated": True,
+                "message": "Valid TIDAL session",
+                "session_id": session_id,
+                "user": user_info,
+            }
 
         return {
             "status": "not_authenticated",
@@ -257,20 +405,11 @@ class SessionManager:
         if not env_user_id:
             return {"authenticated": False, "message": "No session_id provided and TIDAL_USER_ID not set"}
 
-        session_data = self._storage.load_session_sync(env_user_id)
-        if not session_data:
+        exists, user_info = self._validate_stored_session(env_user_id)
+        if not exists:
             return {"authenticated": False, "message": "No session found"}
 
-        session = BrowserSession()
-        success = session.load_from_data(session_data)
-
-        if success and session.check_login() and session.user:
-            user_info = {
-                "id": str(session.user.id),
-                "username": getattr(session.user, "username", None) or "N/A",
-                "email": getattr(session.user, "email", None) or "N/A",
-            }
-
+        if user_info:
             return {
                 "authenticated": True,
                 "message": "Valid TIDAL session",
@@ -353,7 +492,7 @@ class SessionManager:
         with self._lock:
             if session_id in self._pending_logins:
                 result["is_pending"] = True
-                future, expires_in, _ = self._pending_logins[session_id]  # No file_path
+                future, _, _ = self._pending_logins[session_id]
                 result["pending_status"] = "completed" if future.done() else "in_progress"
 
         # Check DiskStore
@@ -6,128 +6,222 @@ DiskStore infrastructure.
 """
 
 import asyncio
+import atexit
+import concurrent.futures
 import json
 import os
 import threading
-
-from cryptography.fernet import Fernet
+import weakref
+from bisect import bisect_left
 
 try:
     from .logger import logger
 except ImportError:
     from logger import logger
 
-try:
-    from key_value.aio.stores.disk import DiskStore
-    from key_value.aio.wrappers.encryption import FernetEncryptionWrapper
-except ImportError:
-    # Fallback if not available
-    DiskStore = None
-    FernetEncryptionWrapper = None
+# Storages not yet closed; held weakly so registering one doesn't keep it alive
+_open_storages: "weakref.WeakSet[SessionStorage]" = weakref.WeakSet()
+
+
+def _close_open_storages() -> None:
+    """Close every storage still open at interpreter exit, flushing its index."""
+    for storage in list(_open_storages):
+        storage.close()
+
+
+atexit.register(_close_open_storages)
+
+
+def _stop_loop(loop: asyncio.AbstractEventLoop, loop_thread: threading.Thread) -> None:
+    """Stop the event loop of a SessionStorage that was garbage collected without close()."""
+    if loop.is_closed():
+        return
+    if loop_thread is threading.current_thread():
+        # Collected on its own loop thread: run_forever returns after this iteration
+        loop.stop()
+        return
+    loop.call_soon_threadsafe(loop.stop)
+    loop_thread.join()
+    loop.close()
 
 
 class SessionStorage:
-    """DiskStore-based session storage with encryption and thread safety."""
+    """
+    DiskStore-based session storage with encryption and thread safety.
+
+    Every coroutine runs on one event loop thread owned by the instance, so sync
+    wrappers called from any thread need no mutex: the loop serializes them, while
+    operations on different sessions still overlap at await points. Index mutations
+    happen between awaits and cannot interleave; only the one-time index load is
+    guarded by an asyncio.Lock.
+    """
 
     INDEX_KEY = "__sessions_index__"
+    _KEY_PREFIX = "session:"
+    INDEX_FLUSH_DELAY = 0.25  # Seconds to batch index updates before writing
 
-    def __init__(self, directory: str, encryption_key: str | None = None):
+    # Backends are imported on first instantiation (see _import_backends)
+    _Fernet = None
+    _DiskStore = None
+    _FernetEncryptionWrapper = None
+
+    @classmethod
+    def _import_backends(cls) -> None:
+        """Import the encryption and DiskStore backends once and cache them on the class."""
+        if cls._Fernet is not None:
+            return
+        try:
+            from key_value.aio.stores.disk import DiskStore
+            from key_value.aio.wrappers.encryption import FernetEncryptionWrapper
+        except ImportError as e:
+            raise ImportError(
+                "key_value.aio is required. Install with: pip install 'py-key-value-aio'"
+            ) from e
+        from cryptography.fernet import Fernet
+
+        cls._DiskStore = DiskStore
+        cls._FernetEncryptionWrapper = FernetEncryptionWrapper
+        cls._Fernet = Fernet
+
+    def __init__(self, directory: str, encryption_key: str | bytes | None = None):
         """
         Initialize session storage.
 
         Args:
             directory: Directory for DiskStore (defaults to ~/.tidal-mcp/sessions)
-            encryption_key: Optional Fernet encryption key (base64 encoded string)
+            encryption_key: Optional Fernet encryption key (base64 encoded str or bytes)
                           If None, generates new key or loads from env
         """
-        if DiskStore is None or FernetEncryptionWrapper is None:
-            raise ImportError(
-                "key_value.aio is required. Install with: pip install 'py-key-value-aio'"
-            )
+        self._import_backends()
+        Fernet = self._Fernet
 
         self._directory = directory
-        self._lock = threading.Lock()  # Thread safety for async operations
 
         # Initialize encryption
+        if not encryption_key:
+            # Try environment variable
+            encryption_key = os.getenv("TIDAL_STORAGE_ENCRYPTION_KEY")
         if encryption_key:
-            fernet = Fernet(encryption_key.encode())
+            # Fernet decodes str and bytes keys alike, no .encode() round trip needed
+            fernet = Fernet(encryption_key)
         else:
-            # Try environment variable
-            env_key = os.getenv("TIDAL_STORAGE_ENCRYPTION_KEY")
-            if env_key:
-                fernet = Fernet(env_key.encode())
-            else:
-                # Generate new key (log warning for production)
-                key = Fernet.generate_key()
-                fernet = Fernet(key)
-                logger.warning(
-                    "Generated new encryption key. Set TIDAL_STORAGE_ENCRYPTION_KEY "
-                    "for production deployments."
-                )
+            # Generate new key (log warning for production)
+            fernet = Fernet(Fernet.generate_key())
+            logger.warning(
+                "Generated new encryption key. Set TIDAL_STORAGE_ENCRYPTION_KEY "
+                "for production deployments."
+            )
+        self._fernet = fernet
 
         # Initialize DiskStore with encryption wrapper
-        disk_store = DiskStore(directory=str(self._directory))
-        self._store = FernetEncryptionWrapper(key_value=disk_store, fernet=fernet)
+        disk_store = self._DiskStore(directory=str(self._directory))
+        self._store = self._FernetEncryptionWrapper(key_value=disk_store, fernet=fernet)
+
+        # Dedicated event loop thread shared by all sync wrappers
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever, name="session-storage-loop", daemon=True
+        )
+        self._loop_thread.start()
+        # Guards the one-time index load; later mutations run between awaits on the loop
+        self._index_lock = asyncio.Lock()
+
+        # Write-behind session index: authoritative in memory, flushed on a debounce
+        self._index_cache: list[str] | None = None  # Sorted session IDs
+        self._index_dirty = False
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_task: asyncio.Task | None = None
+
+        # Pending flushes keep the instance reachable from the loop, so a collected
+        # storage has nothing left to write and only its loop thread needs stopping.
+        self._finalizer = weakref.finalize(self, _stop_loop, self._loop, self._loop_thread)
+        self._finalizer.atexit = False  # _close_open_storages handles exit, with a flush
+        _open_storages.add(self)
 
     def _run_async(self, coro):
-        """Thread-safe wrapper for async operations."""
-        with self._lock:
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # If loop is running, use thread pool
-                    import concurrent.futures
-
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        future = executor.submit(asyncio.run, coro)
-                        return future.result()
-                else:
-                    return loop.run_until_complete(coro)
-            except RuntimeError:
-                return asyncio.run(coro)
-
-    async def _load_index(self) -> set[str]:
-        """Load session index from DiskStore."""
+        """
+        Thread-safe wrapper that runs a coroutine on the storage event loop.
+
+        Must not be called from the loop thread itself (it would wait on its own loop).
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def _load_index(self) -> list[str]:
+        """Load session index from DiskStore as a sorted, de-duplicated list."""
         try:
             index_data = await self._store.get(self.INDEX_KEY)
             if index_data is None:
-                return set()
+                return []
             if isinstance(index_data, bytes):
                 # Handle legacy format (bytes)
-                index_data = json.loads(index_data.decode("utf-8"))
-            return set(index_data.get("session_ids", []))
+                index_data = json.loads(index_data)
+            return sorted(set(index_data.get("session_ids", [])))
         except Exception as e:
             logger.debug(f"Could not load session index: {e}")
-            return set()
+            return []
 
-    async def _save_index(self, session_ids: set[str]) -> None:
-        """Save session index to DiskStore."""
+    async def _save_index(self, session_ids: list[str]) -> bool:
+        """Save session index to DiskStore. Returns False if the write failed."""
         try:
-            index_data = {"session_ids": list(session_ids)}
+            index_data = {"session_ids": session_ids.copy()}
             await self._store.put(self.INDEX_KEY, index_data)
+            return True
         except Exception as e:
             logger.debug(f"Could not save session index: {e}")
+            return False
+
+    async def _get_index(self) -> list[str]:
+        """Get the sorted in-memory session index, loading it from DiskStore on first use."""
+        if self._index_cache is None:
+            async with self._index_lock:
+                if self._index_cache is None:
+                    self._index_cache = await self._load_index()
+        return self._index_cache
+
+    def _schedule_index_flush(self) -> None:
+        """Mark the index dirty and arm a single debounced flush on the storage loop."""
+        self._index_dirty = True
+        if self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(
+                self.INDEX_FLUSH_DELAY, self._on_flush_timer
+            )
+
+    def _on_flush_timer(self) -> None:
+        """Timer callback that starts the index flush."""
+        self._flush_handle = None
+        self._flush_task = self._loop.create_task(self._flush_index())
+
+    async def _flush_index(self) -> None:
+        """Write the in-memory index to DiskStore if it has pending changes."""
+        if not self._index_dirty:
+            return
+        self._index_dirty = False
+        if not await self._save_index(self._index_cache):
+            # Keep the changes pending and retry after another delay
+            self._schedule_index_flush()
 
     async def save_session(self, session_id: str, session_data: dict) -> None:
         """Save session data to DiskStore and update index."""
-        key = f"session:{session_id}"
+        key = self._KEY_PREFIX + session_id
         await self._store.put(key, session_data)
 
-        # Update index in DiskStore
-        session_ids = await self._load_index()
-        session_ids.add(session_id)
-        await self._save_index(session_ids)
+        # Update in-memory index; the DiskStore write is batched
+        session_ids = await self._get_index()
+        i = bisect_left(session_ids, session_id)
+        if i == len(session_ids) or session_ids[i] != session_id:
+            session_ids.insert(i, session_id)
+            self._schedule_index_flush()
 
     async def load_session(self, session_id: str) -> dict | None:
         """Load session data from DiskStore."""
-        key = f"session:{session_id}"
+        key = self._KEY_PREFIX + session_id
         try:
             value = await self._store.get(key)
             if value is None:
                 return None
             if isinstance(value, bytes):
                 # Handle legacy format (bytes)
-                return json.loads(value.decode("utf-8"))
+                return json.loads(value)
             return value
         except Exception as e:
             logger.debug(f"Could not load session {session_id}: {e}")
@@ -142,20 +236,47 @@ class SessionStorage:
         """
         List all session IDs.
 
-        Returns session IDs from the index stored in DiskStore.
+        Returns session IDs from the in-memory index, loaded from DiskStore on first use.
         """
-        session_ids = await self._load_index()
-        return list(session_ids)
+        session_ids = await self._get_index()
+        return session_ids.copy()
 
     async def delete_session(self, session_id: str) -> None:
         """Delete a session and update index."""
-        key = f"session:{session_id}"
+        key = self._KEY_PREFIX + session_id
         await self._store.delete(key)
 
-        # Update index in DiskStore
-        session_ids = await self._load_index()
-        session_ids.discard(session_id)
-        await self._save_index(session_ids)
+        # Update in-memory index; the DiskStore write is batched
+        session_ids = await self._get_index()
+        i = bisect_left(session_ids, session_id)
+        if i < len(session_ids) and session_ids[i] == session_id:
+            del session_ids[i]
+            self._schedule_index_flush()
+
+    async def _shutdown(self) -> None:
+        """Cancel the pending flush timer and write any outstanding index changes."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._flush_task is not None:
+            # A timer-started flush may be mid-write with the dirty flag already cleared
+            await self._flush_task
+        await self._flush_index()
+        if self._flush_handle is not None:
+            # The final write failed; the loop is stopping, so drop the retry
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+    def close(self) -> None:
+        """Flush pending index updates and stop the storage event loop."""
+        if self._loop.is_closed():
+            return
+        self._run_async(self._shutdown())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+        self._loop.close()
+        self._finalizer.detach()
+        _open_storages.discard(self)
 
     # Sync wrappers for SessionManager
     def save_session_sync(self, session_id: str, session_data: dict) -> None:
@@ -166,6 +287,14 @@ class SessionStorage:
         """Thread-safe sync wrapper for load_session."""
         return self._run_async(self.load_session(session_id))
 
+    def load_session_future(self, session_id: str) -> concurrent.futures.Future:
+        """
+        Start load_session on the storage loop and return without waiting.
+
+        Lets callers overlap the disk read with other work; call .result() to collect it.
+        """
+        return asyncio.run_coroutine_threadsafe(self.load_session(session_id), self._loop)
+
     def session_exists_sync(self, session_id: str) -> bool:
         """Thread-safe sync wrapper for session_exists."""
         return self._run_async(self.session_exists(session_id))
@@ -5,6 +5,14 @@ Core business logic for TIDAL operations using dependency injection.
 """
 
 import concurrent.futures
+import functools
+import operator
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import tidalapi
 
 try:
     from .interfaces import ISessionManager
@@ -26,7 +34,7 @@ try:
         TracksResponse,
     )
     from .utils import (
-        TIDAL_PLAYLIST_URL_TEMPLATE,
+        TIDAL_PLAYLIST_URL_PREFIX,
         bound_limit,
         format_album_data,
         format_artist_data,
@@ -52,34 +60,182 @@ except ImportError:
         TracksResponse,
     )
     from utils import (
-        TIDAL_PLAYLIST_URL_TEMPLATE,
+        TIDAL_PLAYLIST_URL_PREFIX,
         bound_limit,
         format_album_data,
         format_artist_data,
         format_track_data,
     )
 
+# Upper bound on concurrent track radio requests in one batch
+MAX_BATCH_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# search_tidal result type -> tidalapi model and formatter
+_SEARCH_MODEL_MAP = {
+    "tracks": tidalapi.Track,
+    "albums": tidalapi.Album,
+    "artists": tidalapi.Artist,
+}
+_SEARCH_FORMATTERS = {
+    "tracks": format_track_data,
+    "albums": format_album_data,
+    "artists": format_artist_data,
+}
+
+# Fields read from a tidalapi playlist in one C-level call
+_PLAYLIST_FIELDS = operator.attrgetter(
+    "id", "name", "description", "created", "last_updated", "num_tracks", "duration"
+)
+
+
+def _invalidate_session_on_error(method):
+    """Drop the cached session when a service method fails, so the next call re-authenticates."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        except ValueError:
+            # Raised by the service itself for bad input or missing items; session is fine
+            raise
+        except Exception:
+            self._drop_session()
+            raise
+
+    return wrapper
+
+
+def _try_format(track) -> TrackModel | None:
+    """Format a track, logging and returning None if the track can't be formatted."""
+    try:
+        return format_track_data(track)
+    except Exception as e:
+        logger.warning(f"Error formatting track: {e}")
+        return None
+
 
 class TidalService:
     """Service for TIDAL operations with dependency injection."""
 
-    def __init__(self, session_manager: ISessionManager):
+    TRACK_CACHE_MAX = 4096  # Upper bound on cached Track objects
+    TRACK_CACHE_TTL = 300.0  # Seconds a cached Track (and the session it holds) is reused
+
+    def __init__(
+        self, session_manager: ISessionManager, max_batch_workers: int = MAX_BATCH_WORKERS
+    ):
         """
         Initialize TIDAL service.
 
         Args:
             session_manager: Session manager for authentication
+            max_batch_workers: Maximum worker threads for batch recommendations
         """
         self.session_manager = session_manager
         self._current_session_id: str | None = None
+        self._session_cache: tuple | None = None  # (session_id, authenticated session)
+        # Shared across calls; threads are spawned lazily up to max_batch_workers
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_batch_workers, thread_name_prefix="tidal-svc"
+        )
+        # (session_id, track_id) -> (expiry (monotonic), Track), least recently used first
+        self._track_cache: OrderedDict[tuple, tuple] = OrderedDict()
+        self._track_cache_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Shut down the worker pool without waiting for in-flight requests."""
+        self._executor.shutdown(wait=False)
 
     def set_session_id(self, session_id: str | None) -> None:
         """Set the current session ID for this service instance."""
         self._current_session_id = session_id
 
+    def _get_session(self) -> tuple:
+        """
+        Return (session_id, authenticated session) for the current session_id.
+
+        The session_id is read once here; callers use the returned id rather than
+        re-reading it, since set_session_id may re-point the service concurrently.
+        The session is reused across calls until the session_id changes or a service
+        method fails (see _invalidate_session_on_error).
+        """
+        session_id = self._current_session_id
+        cached = self._session_cache
+        if cached is not None and cached[0] == session_id:
+            return cached
+        session = self.session_manager.get_authenticated_session(session_id)
+        self._session_cache = (session_id, session)
+        return session_id, session
+
+    def _drop_session(self) -> None:
+        """Forget the cached session and the Track objects bound to it."""
+        self._session_cache = None
+        with self._track_cache_lock:
+            self._track_cache.clear()
+
+    def _get_track(self, session, session_id: str | None, track_id: str):
+        """
+        Fetch a track, reusing a recent Track object fetched for the same session_id.
+
+        Safe to call from worker threads. Entries are keyed by session_id because each
+        Track keeps a reference to the session that fetched it.
+        """
+        key = (session_id, track_id)
+        now = time.monotonic()
+        with self._track_cache_lock:
+            entry = self._track_cache.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._track_cache.move_to_end(key)
+                    return entry[1]
+                del self._track_cache[key]
+
+        track = session.track(track_id)
+        if track:
+            with self._track_cache_lock:
+                self._track_cache[key] = (now + self.TRACK_CACHE_TTL, track)
+                self._track_cache.move_to_end(key)
+                if len(self._track_cache) > self.TRACK_CACHE_MAX:
+                    self._track_cache.popitem(last=False)
+        return track
+
+    @staticmethod
+    def _format_playlist(playlist) -> PlaylistModel:
+        """Format a tidalapi playlist into a PlaylistModel."""
+        try:
+            (
+                playlist_id,
+                name,
+                description,
+                created,
+                last_updated,
+                num_tracks,
+                duration,
+            ) = _PLAYLIST_FIELDS(playlist)
+        except AttributeError:
+            # An optional field is missing; id and name are still required
+            playlist_id = playlist.id
+            name = playlist.name
+            description = getattr(playlist, "description", "")
+            created = getattr(playlist, "created", None)
+            last_updated = getattr(playlist, "last_updated", None)
+            num_tracks = getattr(playlist, "num_tracks", 0)
+            duration = getattr(playlist, "duration", 0)
+
+        return PlaylistModel(
+            id=str(playlist_id),
+            title=name,
+            description=description or "",
+            created=created,
+            last_updated=last_updated,
+            track_count=num_tracks or 0,
+            duration=duration or 0,
+            url=TIDAL_PLAYLIST_URL_PREFIX + str(playlist_id),
+        )
+
+    @_invalidate_session_on_error
     def get_favorite_tracks(self, limit: int = 20) -> TracksResponse:
         """Get tracks from user's favorites."""
-        session = self.session_manager.get_authenticated_session(self._current_session_id)
+        _, session = self._get_session()
         favorites = session.user.favorites
         limit = bound_limit(limit)
 
@@ -92,89 +248,114 @@ class TidalService:
             if hasattr(tracks, "__iter__") and not isinstance(tracks, (list, tuple, str)):
                 tracks = list(tracks)
 
-        track_list = []
-        for track in tracks:
-            try:
-                track_list.append(format_track_data(track))
-            except Exception as e:
-                logger.warning(f"Error formatting track: {e}")
-                continue
+        track_list = [t for t in map(_try_format, tracks) if t is not None]
 
         return TracksResponse(tracks=track_list)
 
+    @_invalidate_session_on_error
     def get_track_recommendations(self, track_id: str, limit: int = 20) -> RecommendationsResponse:
         """Get recommended tracks based on a specific track."""
-        session = self.session_manager.get_authenticated_session(self._current_session_id)
+        session_id, session = self._get_session()
         limit = bound_limit(limit)
 
-        track = session.track(track_id)
+        track = self._get_track(session, session_id, track_id)
         if not track:
             raise ValueError(f"Track with ID {track_id} not found")
 
         recommendations = track.get_track_radio(limit=limit)
-        track_list = [format_track_data(track) for track in recommendations]
+        track_list = list(map(format_track_data, recommendations))
 
         return RecommendationsResponse(recommendations=track_list)
 
+    @_invalidate_session_on_error
     def get_batch_recommendations(
-        self, track_ids: list[str], limit_per_track: int = 20, remove_duplicates: bool = True
+        self,
+        track_ids: list[str],
+        limit_per_track: int = 20,
+        remove_duplicates: bool = True,
+        max_results: int | None = None,
     ) -> BatchRecommendationsResponse:
-        """Get recommended tracks based on multiple track IDs."""
-        session = self.session_manager.get_authenticated_session(self._current_session_id)
+        """
+        Get recommended tracks based on multiple track IDs.
+
+        If max_results is set, stops once that many tracks are collected and cancels
+        per-track requests that have not started yet.
+
+        Raises:
+            RuntimeError: If the request failed for every track, e.g. because the
+                session is no longer authenticated
+        """
+        if not track_ids or (max_results is not None and max_results <= 0):
+            return BatchRecommendationsResponse(recommendations=[])
+
+        session_id, session = self._get_session()
         limit_per_track = bound_limit(limit_per_track)
 
-        def get_track_recommendations_single(track_id: str) -> list[TrackModel]:
+        if remove_duplicates:
+            # Repeated source tracks would only yield recommendations we drop anyway
+            track_ids = list(dict.fromkeys(track_ids))
+
+        def get_track_recommendations_single(track_id: str) -> list[TrackModel] | None:
             try:
-                track = session.track(track_id)
+                track = self._get_track(session, session_id, track_id)
                 recommendations = track.get_track_radio(limit=limit_per_track)
                 return [format_track_data(rec, source_track_id=track_id) for rec in recommendations]
             except Exception as e:
                 logger.warning(f"Error getting recommendations for track {track_id}: {str(e)}")
-                return []
+                return None
 
         all_recommendations = []
-        seen_track_ids = set()
+        failed = 0
+        seen_track_ids: set[str] = set()
+
+        future_to_track_id = {
+            self._executor.submit(get_track_recommendations_single, track_id): track_id
+            for track_id in track_ids
+        }
+
+        for future in concurrent.futures.as_completed(future_to_track_id):
+            track_recommendations = future.result()
+            if track_recommendations is None:
+                failed += 1
+                continue
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=len(track_ids)) as executor:
-            future_to_track_id = {
-                executor.submit(get_track_recommendations_single, track_id): track_id
-                for track_id in track_ids
-            }
+            for track_data in track_recommendations:
+                track_id = track_data.id
 
-            for future in concurrent.futures.as_completed(future_to_track_id):
-                track_recommendations = future.result()
+                # Compare ids, not objects: identical tracks share one cached TrackModel
+                if remove_duplicates and track_id:
+                    if track_id in seen_track_ids:
+                        continue
+                    seen_track_ids.add(track_id)
 
-                for track_data in track_recommendations:
-                    track_id = track_data.id
+                all_recommendations.append(track_data)
 
-                    if remove_duplicates and track_id and track_id in seen_track_ids:
-                        continue
+                if max_results is not None and len(all_recommendations) >= max_results:
+                    break
+
+            if max_results is not None and len(all_recommendations) >= max_results:
+                # Drop per-track requests still waiting for a worker
+                for pending in future_to_track_id:
+                    pending.cancel()
+                break
 
-                    all_recommendations.append(track_data)
-                    if track_id:
-                        seen_track_ids.add(track_id)
+        if failed == len(future_to_track_id):
+            # Nothing succeeded; surface it so the cached session is dropped
+            raise RuntimeError(f"Failed to get recommendations for all {failed} tracks")
 
         return BatchRecommendationsResponse(recommendations=all_recommendations)
 
+    @_invalidate_session_on_error
     def create_playlist(
         self, title: str, track_ids: list[str], description: str = ""
     ) -> CreatePlaylistResponse:
         """Create a new TIDAL playlist with specified tracks."""
-        session = self.session_manager.get_authenticated_session(self._current_session_id)
+        _, session = self._get_session()
 
         playlist = session.user.create_playlist(title, description)
         playlist.add(track_ids)
 
-        playlist_info = PlaylistModel(
-            id=str(playlist.id),
-            title=playlist.name,
-            description=getattr(playlist, "description", "") or "",
-            created=getattr(playlist, "created", None),
-            last_updated=getattr(playlist, "last_updated", None),
-            track_count=getattr(playlist, "num_tracks", 0) or 0,
-            duration=getattr(playlist, "duration", 0) or 0,
-            url=TIDAL_PLAYLIST_URL_TEMPLATE.format(playlist_id=playlist.id),
-        )
+        playlist_info = self._format_playlist(playlist)
 
         return CreatePlaylistResponse(
             status="success",
@@ -182,32 +363,22 @@ class TidalService:
             playlist=playlist_info,
         )
 
+    @_invalidate_session_on_error
     def get_user_playlists(self) -> PlaylistsResponse:
         """Get user's playlists from TIDAL."""
-        session = self.session_manager.get_authenticated_session(self._current_session_id)
+        _, session = self._get_session()
         playlists = session.user.playlists()
 
-        playlist_list = []
-        for playlist in playlists:
-            playlist_info = PlaylistModel(
-                id=str(playlist.id),
-                title=playlist.name,
-                description=getattr(playlist, "description", "") or "",
-                created=getattr(playlist, "created", None),
-                last_updated=getattr(playlist, "last_updated", None),
-                track_count=getattr(playlist, "num_tracks", 0) or 0,
-                duration=getattr(playlist, "duration", 0) or 0,
-                url=TIDAL_PLAYLIST_URL_TEMPLATE.format(playlist_id=playlist.id),
-            )
-            playlist_list.append(playlist_info)
+        playlist_list = [self._format_playlist(p) for p in playlists]
 
         sorted_playlists = sorted(playlist_list, key=lambda x: x.last_updated or "", reverse=True)
 
         return PlaylistsResponse(playlists=sorted_playlists)
 
+    @_invalidate_session_on_error
     def get_playlist_tracks(self, playlist_id: str, limit: int = 100) -> PlaylistTracksResponse:
         """Get tracks from a specific TIDAL playlist."""
-        session = self.session_manager.get_authenticated_session(self._current_session_id)
+        _, session = self._get_session()
         limit = bound_limit(limit, max_n=100)
 
         playlist = session.playlist(playlist_id)
@@ -215,15 +386,16 @@ class TidalService:
             raise ValueError(f"Playlist with ID {playlist_id} not found")
 
         tracks = playlist.items(limit=limit)
-        track_list = [format_track_data(track) for track in tracks]
+        track_list = list(map(format_track_data, tracks))
 
         return PlaylistTracksResponse(
             playlist_id=str(playlist.id), tracks=track_list, total_tracks=len(track_list)
         )
 
+    @_invalidate_session_on_error
     def delete_playlist(self, playlist_id: str) -> DeletePlaylistResponse:
         """Delete a TIDAL playlist by its ID."""
-        session = self.session_manager.get_authenticated_session(self._current_session_id)
+        _, session = self._get_session()
 
         playlist = session.playlist(playlist_id)
         if not playlist:
@@ -235,41 +407,27 @@ class TidalService:
             status="success", message=f"Playlist with ID {playlist_id} was successfully deleted"
         )
 
+    @_invalidate_session_on_error
     def search_tidal(
         self, query: str, limit: int = 20, search_types: str = "tracks,albums,artists"
     ) -> SearchResponse:
         """Search for tracks, albums, and/or artists on TIDAL."""
-        import tidalapi
-
-        session = self.session_manager.get_authenticated_session(self._current_session_id)
+        _, session = self._get_session()
         limit = bound_limit(limit)
-        types_list = [t.strip().lower() for t in search_types.split(",")]
-
-        models = []
-        if "tracks" in types_list:
-            models.append(tidalapi.Track)
-        if "albums" in types_list:
-            models.append(tidalapi.Album)
-        if "artists" in types_list:
-            models.append(tidalapi.Artist)
+        requested = frozenset(t.strip().lower() for t in search_types.split(","))
+        # Iterate the map, not the set, so the model order is stable
+        types = [t for t in _SEARCH_MODEL_MAP if t in requested]
 
-        if not models:
+        if not types:
             raise ValueError("Invalid types. Must include at least one of: tracks, albums, artists")
 
+        models = [_SEARCH_MODEL_MAP[t] for t in types]
         results = session.search(query, models=models, limit=limit)
 
         formatted_results = SearchResultsModel(tracks=[], albums=[], artists=[])
-
-        if "tracks" in types_list and "tracks" in results:
-            formatted_results.tracks = [format_track_data(track) for track in results["tracks"]]
-
-        if "albums" in types_list and "albums" in results:
-            formatted_results.albums = [format_album_data(album) for album in results["albums"]]
-
-        if "artists" in types_list and "artists" in results:
-            formatted_results.artists = [
-                format_artist_data(artist) for artist in results["artists"]
-            ]
+        for t in types:
+            if t in results:
+                setattr(formatted_results, t, list(map(_SEARCH_FORMATTERS[t], results[t])))
 
         return SearchResponse(
             query=query,
@@ -279,46 +437,43 @@ class TidalService:
             total_artists=len(formatted_results.artists),
         )
 
+    @_invalidate_session_on_error
     def search_tracks(self, query: str, limit: int = 20) -> SearchTracksResponse:
         """Search for tracks on TIDAL."""
-        import tidalapi
-
-        session = self.session_manager.get_authenticated_session(self._current_session_id)
+        _, session = self._get_session()
         limit = bound_limit(limit)
         results = session.search(query, models=[tidalapi.Track], limit=limit)
 
         tracks = results.get("tracks", [])
-        formatted_tracks = [format_track_data(track) for track in tracks]
+        formatted_tracks = list(map(format_track_data, tracks))
 
         return SearchTracksResponse(
             query=query, tracks=formatted_tracks, total=len(formatted_tracks)
         )
 
+    @_invalidate_session_on_error
     def search_albums(self, query: str, limit: int = 20) -> SearchAlbumsResponse:
         """Search for albums on TIDAL."""
-        import tidalapi
-
-        session = self.session_manager.get_authenticated_session(self._current_session_id)
+        _, session = self._get_session()
         limit = bound_limit(limit)
         results = session.search(query, models=[tidalapi.Album], limit=limit)
 
         albums = results.get("albums", [])
-        formatted_albums = [format_album_data(album) for album in albums]
+        formatted_albums = list(map(format_album_data, albums))
 
         return SearchAlbumsResponse(
             query=query, albums=formatted_albums, total=len(formatted_albums)
         )
 
+    @_invalidate_session_on_error
     def search_artists(self, query: str, limit: int = 20) -> SearchArtistsResponse:
         """Search for artists on TIDAL."""
-        import tidalapi
-
-        session = self.session_manager.get_authenticated_session(self._current_session_id)
+        _, session = self._get_session()
         limit = bound_limit(limit)
         results = session.search(query, models=[tidalapi.Artist], limit=limit)
 
         artists = results.get("artists", [])
-        formatted_artists = [format_artist_data(artist) for artist in artists]
+        formatted_artists = list(map(format_artist_data, artists))
 
         return SearchArtistsResponse(
             query=query, artists=formatted_artists, total=len(formatted_artists)
@@ -1,5 +1,9 @@
+import operator
+from functools import lru_cache
+
 # Handle imports for both module and direct execution
 try:
+    from .logger import logger
     from .models import (
         AlbumModel,
         ArtistModel,
@@ -8,6 +12,7 @@ try:
         TrackModel,
     )
 except ImportError:
+    from logger import logger
     from models import (
         AlbumModel,
         ArtistModel,
@@ -22,6 +27,29 @@ TIDAL_TRACK_URL_TEMPLATE = f"{TIDAL_BASE_URL}/browse/track/{{track_id}}?u"
 TIDAL_ALBUM_URL_TEMPLATE = f"{TIDAL_BASE_URL}/browse/album/{{album_id}}?u"
 TIDAL_ARTIST_URL_TEMPLATE = f"{TIDAL_BASE_URL}/browse/artist/{{artist_id}}?u"
 TIDAL_PLAYLIST_URL_TEMPLATE = f"{TIDAL_BASE_URL}/playlist/{{playlist_id}}"
+TIDAL_PLAYLIST_URL_PREFIX = f"{TIDAL_BASE_URL}/playlist/"
+
+# Prefix/suffix pairs for the templates above; concatenation is cheaper than str.format
+_TRACK_URL_PREFIX = f"{TIDAL_BASE_URL}/browse/track/"
+_ALBUM_URL_PREFIX = f"{TIDAL_BASE_URL}/browse/album/"
+_ARTIST_URL_PREFIX = f"{TIDAL_BASE_URL}/browse/artist/"
+_URL_SUFFIX = "?u"
+
+# Placeholders for missing names
+_UNKNOWN = "Unknown"
+_UNKNOWN_TRACK = "Unknown Track"
+_UNKNOWN_ALBUM = "Unknown Album"
+_UNKNOWN_ARTIST = "Unknown Artist"
+
+# Fields read from tidalapi objects in one C-level call
+_TRACK_FIELDS = operator.attrgetter("id", "name", "duration", "artist", "album")
+_ALBUM_FIELDS = operator.attrgetter(
+    "id", "name", "release_date", "duration", "num_tracks", "artist"
+)
+
+
+# Result of the first configure_ssl_certificates() call; None until it has run
+_SSL_CONFIGURED: bool | None = None
 
 
 def configure_ssl_certificates() -> bool:
@@ -30,11 +58,20 @@ def configure_ssl_certificates() -> bool:
 
     This function sets up SSL certificate paths for both the ssl module and
     the requests library (used by tidalapi). It handles cases where certifi
-    might not be available or the certificate path might be invalid.
+    might not be available or the certificate path might be invalid. The work
+    is done once per process; later calls return the first result.
 
     Returns:
         True if configuration was successful, False otherwise
     """
+    global _SSL_CONFIGURED
+    if _SSL_CONFIGURED is None:
+        _SSL_CONFIGURED = _configure_ssl_certificates()
+    return _SSL_CONFIGURED
+
+
+def _configure_ssl_certificates() -> bool:
+    """Apply the SSL certificate configuration (see configure_ssl_certificates)."""
     import os
     import ssl
 
@@ -65,72 +102,89 @@ def configure_ssl_certificates() -> bool:
                     )
                     os.environ["REQUESTS_CA_BUNDLE"] = potential_path
                     os.environ["SSL_CERT_FILE"] = potential_path
-                    # Import logger here to avoid circular imports
-                    try:
-                        from .logger import logger
-
-                        logger.info(f"Using certifi from: {potential_path}")
-                    except ImportError:
-                        pass
+                    logger.info(f"Using certifi from: {potential_path}")
                     return True
 
             # If we can't find certifi, use system certificates
-            try:
-                from .logger import logger
-
-                logger.warning(
-                    f"certifi certificate bundle not found at {cert_path}, using system certificates"
-                )
-            except ImportError:
-                pass
+            logger.warning(
+                f"certifi certificate bundle not found at {cert_path}, using system certificates"
+            )
             ssl._create_default_https_context = ssl.create_default_context
             return True
 
     except ImportError:
         # certifi not available, use system defaults
-        try:
-            from .logger import logger
-
-            logger.warning("certifi not available, using system SSL certificates")
-        except ImportError:
-            pass
+        logger.warning("certifi not available, using system SSL certificates")
         ssl._create_default_https_context = ssl.create_default_context
         return False
     except Exception as e:
-        try:
-            from .logger import logger
-
-            logger.warning(f"Could not configure SSL certificates: {e}, using system defaults")
-        except ImportError:
-            pass
+        logger.warning(f"Could not configure SSL certificates: {e}, using system defaults")
         ssl._create_default_https_context = ssl.create_default_context
         return False
 
 
-def _safe_get_attr(obj, attr: str, default=None):
-    """Safely get an attribute from an object."""
-    try:
-        return getattr(obj, attr, default)
-    except (AttributeError, TypeError):
-        return default
-
-
 def _safe_get_name(obj) -> str:
     """Safely extract a name from an object (artist, album, etc.)."""
     if obj is None:
-        return "Unknown"
-
+        return _UNKNOWN
     try:
-        if hasattr(obj, "name"):
-            return obj.name
-        elif isinstance(obj, str):
+        name = obj.name
+    except AttributeError:
+        if isinstance(obj, str):
             return obj
-        elif hasattr(obj, "__str__"):
+        try:
             return str(obj)
-    except (AttributeError, TypeError):
-        pass
+        except (AttributeError, TypeError):
+            return _UNKNOWN
+    return name or _UNKNOWN
 
-    return "Unknown"
+
+def _track_core(track_id, track_name, duration, artist_obj, album_obj) -> tuple:
+    """
+    Normalize raw track fields into the values shared by every track model.
+
+    Returns:
+        Tuple of (id, title, artist, album, duration, url) ready for the model
+    """
+    track_id_str = str(track_id) if track_id else None
+    url = _TRACK_URL_PREFIX + track_id_str + _URL_SUFFIX if track_id_str else None
+
+    return (
+        track_id_str,
+        track_name,
+        _safe_get_name(artist_obj),
+        _safe_get_name(album_obj),
+        duration or 0,
+        url,
+    )
+
+
+def _track_core_from_obj(track) -> tuple:
+    """Extract the shared track fields from a TIDAL track object."""
+    try:
+        fields = _TRACK_FIELDS(track)
+    except AttributeError:
+        # A field is missing; fall back to per-field defaults
+        fields = (
+            getattr(track, "id", None),
+            getattr(track, "name", _UNKNOWN_TRACK),
+            getattr(track, "duration", 0),
+            getattr(track, "artist", None),
+            getattr(track, "album", None),
+        )
+    return _track_core(*fields)
+
+
+def _track_core_from_dict(track: dict) -> tuple:
+    """Extract the shared track fields from a track dict ('title' is accepted for 'name')."""
+    get = track.get
+    return _track_core(
+        get("id"),
+        get("name", get("title", _UNKNOWN_TRACK)),
+        get("duration", 0),
+        get("artist"),
+        get("album"),
+    )
 
 
 def format_track_data(track, source_track_id: str = None) -> TrackModel:
@@ -144,25 +198,30 @@ def format_track_data(track, source_track_id: str = None) -> TrackModel:
     Returns:
         TrackModel with standardized track information
     """
-    track_id = _safe_get_attr(track, "id")
-    track_name = _safe_get_attr(track, "name", "Unknown Track")
-    duration = _safe_get_attr(track, "duration", 0)
-    artist_obj = _safe_get_attr(track, "artist")
-    album_obj = _safe_get_attr(track, "album")
-
-    artist_name = _safe_get_name(artist_obj)
-    album_name = _safe_get_name(album_obj)
-
-    url = TIDAL_TRACK_URL_TEMPLATE.format(track_id=track_id) if track_id else None
-
+    core = _track_core_from_dict(track) if isinstance(track, dict) else _track_core_from_obj(track)
+
+    return _build_track_model(*core, str(source_track_id) if source_track_id else None)
+
+
+@lru_cache(maxsize=4096)
+def _build_track_model(
+    track_id_str: str | None,
+    title: str,
+    artist: str,
+    album: str,
+    duration: int,
+    url: str | None,
+    source_track_id: str | None,
+) -> TrackModel:
+    """Build a TrackModel, reusing the instance when the same track recurs."""
     return TrackModel(
-        id=str(track_id) if track_id else None,
-        title=track_name,
-        artist=artist_name,
-        album=album_name,
-        duration=duration or 0,
+        id=track_id_str,
+        title=title,
+        artist=artist,
+        album=album,
+        duration=duration,
         url=url,
-        source_track_id=str(source_track_id) if source_track_id else None,
+        source_track_id=source_track_id,
     )
 
 
@@ -176,23 +235,48 @@ def format_album_data(album) -> AlbumModel:
     Returns:
         AlbumModel with standardized album information
     """
-    album_id = _safe_get_attr(album, "id")
-    album_name = _safe_get_attr(album, "name", "Unknown Album")
-    release_date = _safe_get_attr(album, "release_date")
-    duration = _safe_get_attr(album, "duration", 0)
-    num_tracks = _safe_get_attr(album, "num_tracks", 0)
-    artist_obj = _safe_get_attr(album, "artist")
+    try:
+        album_id, album_name, release_date, duration, num_tracks, artist_obj = _ALBUM_FIELDS(album)
+    except AttributeError:
+        # A field is missing; fall back to per-field defaults
+        album_id = getattr(album, "id", None)
+        album_name = getattr(album, "name", _UNKNOWN_ALBUM)
+        release_date = getattr(album, "release_date", None)
+        duration = getattr(album, "duration", 0)
+        num_tracks = getattr(album, "num_tracks", 0)
+        artist_obj = getattr(album, "artist", None)
 
     artist_name = _safe_get_name(artist_obj)
-    url = TIDAL_ALBUM_URL_TEMPLATE.format(album_id=album_id) if album_id else None
+
+    return _build_album_model(
+        str(album_id) if album_id else None,
+        album_name,
+        artist_name,
+        str(release_date) if release_date else None,
+        duration or 0,
+        num_tracks or 0,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _build_album_model(
+    album_id_str: str | None,
+    title: str,
+    artist: str,
+    release_date: str | None,
+    duration: int,
+    num_tracks: int,
+) -> AlbumModel:
+    """Build an AlbumModel, reusing the instance when the same album recurs."""
+    url = _ALBUM_URL_PREFIX + album_id_str + _URL_SUFFIX if album_id_str else None
 
     return AlbumModel(
-        id=str(album_id) if album_id else None,
-        title=album_name,
-        artist=artist_name,
-        release_date=str(release_date) if release_date else None,
-        duration=duration or 0,
-        num_tracks=num_tracks or 0,
+        id=album_id_str,
+        title=title,
+        artist=artist,
+        release_date=release_date,
+        duration=duration,
+        num_tracks=num_tracks,
         url=url,
     )
 
@@ -207,11 +291,18 @@ def format_artist_data(artist) -> ArtistModel:
     Returns:
         ArtistModel with standardized artist information
     """
-    artist_id = _safe_get_attr(artist, "id")
-    artist_name = _safe_get_attr(artist, "name", "Unknown Artist")
-    url = TIDAL_ARTIST_URL_TEMPLATE.format(artist_id=artist_id) if artist_id else None
+    artist_id = getattr(artist, "id", None)
+    artist_name = getattr(artist, "name", _UNKNOWN_ARTIST)
+
+    return _build_artist_model(str(artist_id) if artist_id else None, artist_name)
+
+
+@lru_cache(maxsize=1024)
+def _build_artist_model(artist_id_str: str | None, name: str) -> ArtistModel:
+    """Build an ArtistModel, reusing the instance when the same artist recurs."""
+    url = _ARTIST_URL_PREFIX + artist_id_str + _URL_SUFFIX if artist_id_str else None
 
-    return ArtistModel(id=str(artist_id) if artist_id else None, name=artist_name, url=url)
+    return ArtistModel(id=artist_id_str, name=name, url=url)
 
 
 def format_recently_played_item(track, played_at=None) -> RecentlyPlayedItem:
@@ -227,47 +318,55 @@ def format_recently_played_item(track, played_at=None) -> RecentlyPlayedItem:
     """
     # Handle both track objects and dicts
     if isinstance(track, dict):
-        track_id = track.get("id")
-        track_name = track.get("name", track.get("title", "Unknown Track"))
-        duration = track.get("duration", 0)
-        artist_obj = track.get("artist")
-        album_obj = track.get("album")
-        played_at = track.get("played_at") or played_at
-    else:
-        track_id = _safe_get_attr(track, "id")
-        track_name = _safe_get_attr(track, "name", "Unknown Track")
-        duration = _safe_get_attr(track, "duration", 0)
-        artist_obj = _safe_get_attr(track, "artist")
-        album_obj = _safe_get_attr(track, "album")
-        # Try to get played_at from track object if available
-        if played_at is None:
-            played_at = _safe_get_attr(track, "played_at")
+        return _recently_played_from_dict(track, played_at)
+    return _recently_played_from_obj(track, played_at)
 
-    artist_name = _safe_get_name(artist_obj)
-    album_name = _safe_get_name(album_obj)
 
-    url = TIDAL_TRACK_URL_TEMPLATE.format(track_id=track_id) if track_id else None
+def _recently_played_from_obj(track, played_at) -> RecentlyPlayedItem:
+    """Build a RecentlyPlayedItem from a track object."""
+    track_id_str, track_name, artist_name, album_name, duration, url = _track_core_from_obj(track)
+
+    # Try to get played_at from track object if available
+    if played_at is None:
+        played_at = getattr(track, "played_at", None)
 
     return RecentlyPlayedItem(
-        id=str(track_id) if track_id else None,
+        id=track_id_str,
         title=track_name,
         artist=artist_name,
         album=album_name,
-        duration=duration or 0,
+        duration=duration,
         url=url,
         played_at=played_at,
     )
 
 
+def _recently_played_from_dict(track: dict, played_at) -> RecentlyPlayedItem:
+    """Build a RecentlyPlayedItem from a track dict; its played_at takes precedence."""
+    track_id_str, track_name, artist_name, album_name, duration, url = _track_core_from_dict(track)
+    track_played_at = track.get("played_at")
+
+    return RecentlyPlayedItem(
+        id=track_id_str,
+        title=track_name,
+        artist=artist_name,
+        album=album_name,
+        duration=duration,
+        url=url,
+        played_at=played_at if track_played_at is None else track_played_at,
+    )
+
+
 def format_playback_history_item(
-    track, play_count: int = 1, first_played=None, last_played=None
+    track, play_count: int | None = None, first_played=None, last_played=None
 ) -> PlaybackHistoryItem:
     """
     Format a track object into a PlaybackHistoryItem with play count and timestamps.
 
     Args:
         track: TIDAL track object or dict with track information
-        play_count: Number of times the track was played
+        play_count: Number of times the track was played; if None, taken from the track
+                    (defaulting to 1)
         first_played: Optional datetime when the track was first played
         last_played: Optional datetime when the track was last played
 
@@ -276,39 +375,64 @@ def format_playback_history_item(
     """
     # Handle both track objects and dicts
     if isinstance(track, dict):
-        track_id = track.get("id")
-        track_name = track.get("name", track.get("title", "Unknown Track"))
-        duration = track.get("duration", 0)
-        artist_obj = track.get("artist")
-        album_obj = track.get("album")
-        play_count = track.get("play_count", play_count)
-        first_played = track.get("first_played") or first_played
-        last_played = track.get("last_played") or last_played
-    else:
-        track_id = _safe_get_attr(track, "id")
-        track_name = _safe_get_attr(track, "name", "Unknown Track")
-        duration = _safe_get_attr(track, "duration", 0)
-        artist_obj = _safe_get_attr(track, "artist")
-        album_obj = _safe_get_attr(track, "album")
-        # Try to get play count and timestamps from track object if available
-        if play_count == 1:
-            play_count = _safe_get_attr(track, "play_count", 1)
-        if first_played is None:
-            first_played = _safe_get_attr(track, "first_played")
-        if last_played is None:
-            last_played = _safe_get_attr(track, "last_played")
+        return _playback_history_from_dict(track, play_count, first_played, last_played)
+    return _playback_history_from_obj(track, play_count, first_played, last_played)
 
-    artist_name = _safe_get_name(artist_obj)
-    album_name = _safe_get_name(album_obj)
 
-    url = TIDAL_TRACK_URL_TEMPLATE.format(track_id=track_id) if track_id else None
+def _playback_history_from_obj(
+    track, play_count: int | None, first_played, last_played
+) -> PlaybackHistoryItem:
+    """Build a PlaybackHistoryItem from a track object."""
+    track_id_str, track_name, artist_name, album_name, duration, url = _track_core_from_obj(track)
+
+    # Try to get play count and timestamps from track object if available
+    if play_count is None:
+        play_count = getattr(track, "play_count", None)
+        if play_count is None:
+            play_count = 1
+    if first_played is None:
+        first_played = getattr(track, "first_played", None)
+    if last_played is None:
+        last_played = getattr(track, "last_played", None)
+
+    return PlaybackHistoryItem(
+        id=track_id_str,
+        title=track_name,
+        artist=artist_name,
+        album=album_name,
+        duration=duration,
+        url=url,
+        play_count=play_count,
+        first_played=first_played,
+        last_played=last_played,
+    )
+
+
+def _playback_history_from_dict(
+    track: dict, play_count: int | None, first_played, last_played
+) -> PlaybackHistoryItem:
+    """Build a PlaybackHistoryItem from a track dict; its non-None values take precedence."""
+    track_id_str, track_name, artist_name, album_name, duration, url = _track_core_from_dict(track)
+    get = track.get
+
+    value = get("play_count")
+    if value is not None:
+        play_count = value
+    elif play_count is None:
+        play_count = 1
+    value = get("first_played")
+    if value is not None:
+        first_played = value
+    value = get("last_played")
+    if value is not None:
+        last_played = value
 
     return PlaybackHistoryItem(
-        id=str(track_id) if track_id else None,
+        id=track_id_str,
         title=track_name,
         artist=artist_name,
         album=album_name,
-        duration=duration or 0,
+        duration=duration,
         url=url,
         play_count=play_count,
         first_played=first_played,
@@ -317,10 +441,5 @@ def format_playback_history_item(
 
 
 def bound_limit(limit: int, max_n: int = 50) -> int:
-    # Ensure limit is within reasonable bounds
-    if limit < 1:
-        limit = 1
-    elif limit > max_n:
-        limit = max_n
-    # Note: Logging removed here to avoid noise - limit validation is sufficient
-    return limit
+    """Clamp limit to the range [1, max_n]."""
+    return 1 if limit < 1 else max_n if limit > max_n else limit